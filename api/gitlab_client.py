@@ -1,35 +1,54 @@
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, Any, Optional
 
+import orjson
 import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
+
+from api.http import make_session
 
 logger = logging.getLogger(__name__)
 
+# Fork 후 maintainer 권한으로 보호할 브랜치 목록
+PROTECTED_BRANCHES = ('test', 'main')
+
+# Fork 후 설정 작업(fork relationship 삭제 + 브랜치 보호) 실행용 스레드 풀
+# fork마다 풀을 새로 만들지 않도록 공유하며, 기본 핸들러 스레드 수(4)만큼의 fork를 동시에 처리할 수 있는 크기
+_POST_FORK_CONCURRENCY = 4
+_POST_FORK_POOL = ThreadPoolExecutor(
+    max_workers=(1 + len(PROTECTED_BRANCHES)) * _POST_FORK_CONCURRENCY,
+    thread_name_prefix="gitlab-post-fork"
+)
+
 
 class GitLabClient:
-    def __init__(self, base_url: str, token: str, timeout: int = 30):
+    def __init__(
+        self,
+        base_url: str,
+        token: str,
+        timeout: int = 30,
+        session: Optional[requests.Session] = None
+    ):
         self.base_url = base_url.rstrip('/')
         self.token = token
         self.timeout = timeout
+        # API 기본 URL (요청마다 다시 조합하지 않도록 미리 계산)
+        self._api_base = self.base_url + '/api/v4'
+        # 인스턴스별 인증 헤더 (세션을 여러 GitLab 인스턴스가 공유하므로 요청마다 전달)
+        self._auth_headers = {"Authorization": f"Bearer {token}"}
         
-        # 세션 생성 및 재시도 전략 설정
-        self.session = requests.Session()
-        retry_strategy = Retry(
-            total=3,
-            backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504]
-        )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        self.session.mount("http://", adapter)
-        self.session.mount("https://", adapter)
-        
-        # 기본 헤더 설정
-        self.session.headers.update({
-            "Authorization": f"Bearer {token}",
+        # 세션이 주어지면 공유하고, 없으면 공유 커넥션 풀을 사용하는 세션 생성
+        self.session = session or make_session(headers={
             "Content-Type": "application/json"
         })
+        
+        # HTTP 메서드별 세션 함수 (요청마다 메서드 문자열 분기를 하지 않도록 미리 바인딩)
+        self._methods = {
+            "GET": self.session.get,
+            "POST": self.session.post,
+            "PUT": self.session.put,
+            "DELETE": self.session.delete
+        }
     
     def _request(
         self,
@@ -39,20 +58,21 @@ class GitLabClient:
         json_data: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """HTTP 요청 헬퍼 메서드"""
-        url = f"{self.base_url}/api/v4{endpoint}"
+        url = self._api_base + endpoint
         
         try:
-            response = self.session.request(
-                method=method,
-                url=url,
+            response = self._methods[method](
+                url,
                 params=params,
                 json=json_data,
+                headers=self._auth_headers,
                 timeout=self.timeout
             )
             response.raise_for_status()
-            return response.json() if response.content else {}
-        except requests.exceptions.RequestException as e:
-            logger.error(f"GitLab API request failed: {method} {url}, error: {e}")
+            return orjson.loads(response.content) if response.content else {}
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
+            # orjson.JSONDecodeError는 RequestException이 아니므로 함께 처리 (JSON이 아닌 응답 본문)
+            logger.error("GitLab API request failed: %s %s, error: %s", method, url, e)
             raise
     
     def fork_project(
@@ -82,25 +102,35 @@ class GitLabClient:
         if path:
             json_data["path"] = path
         
-        logger.info(f"Forking project {project_id} with params: {json_data}")
+        logger.info("Forking project %s with params: %s", project_id, json_data)
         result = self._request("POST", f"/projects/{project_id}/fork", json_data=json_data)
         forked_project_id = result.get('id')
-        logger.info(f"Project forked successfully: {forked_project_id}")
+        logger.info("Project forked successfully: %s", forked_project_id)
         
+        # Fork 이후 설정 작업은 서로 독립적이므로 동시에 실행
+        # 모든 요청이 같은 세션의 keep-alive 커넥션 풀을 공유하므로 추가 handshake 없이 ~1 RTT에 완료
+        # 완료되는 순서대로 결과를 확인하여 작업별로 로그 기록
         # 1. Fork relationship 삭제
-        try:
-            self.delete_fork_relationship(forked_project_id)
-            logger.info(f"Fork relationship deleted for project {forked_project_id}")
-        except Exception as e:
-            logger.warning(f"Failed to delete fork relationship for project {forked_project_id}: {e}")
-        
+        futures = {_POST_FORK_POOL.submit(self.delete_fork_relationship, forked_project_id): None}
         # 2. test, main 브랜치를 maintainer 권한으로 protected branch 설정
-        for branch_name in ['test', 'main']:
+        futures.update({
+            _POST_FORK_POOL.submit(self.protect_branch, forked_project_id, branch_name): branch_name
+            for branch_name in PROTECTED_BRANCHES
+        })
+        
+        for future in as_completed(futures):
+            branch_name = futures[future]
             try:
-                self.protect_branch(forked_project_id, branch_name)
-                logger.info(f"Branch {branch_name} protected for project {forked_project_id}")
+                future.result()
+                if branch_name is None:
+                    logger.info("Fork relationship deleted for project %s", forked_project_id)
+                else:
+                    logger.info("Branch %s protected for project %s", branch_name, forked_project_id)
             except Exception as e:
-                logger.warning(f"Failed to protect branch {branch_name} for project {forked_project_id}: {e}")
+                if branch_name is None:
+                    logger.warning("Failed to delete fork relationship for project %s: %s", forked_project_id, e)
+                else:
+                    logger.warning("Failed to protect branch %s for project %s: %s", branch_name, forked_project_id, e)
         
         return result
     
@@ -122,7 +152,7 @@ class GitLabClient:
             추가된 멤버 정보
         """
         # username으로 user_id 조회
-        logger.info(f"Looking up user_id for username: {username}")
+        logger.info("Looking up user_id for username: %s", username)
         users = self._request(
             "GET",
             "/users",
@@ -136,7 +166,7 @@ class GitLabClient:
         if not user_id:
             raise ValueError(f"User ID not found for username '{username}'")
         
-        logger.info(f"Found user_id {user_id} for username {username}")
+        logger.info("Found user_id %s for username %s", user_id, username)
         
         json_data = {
             "user_id": user_id,
@@ -144,15 +174,16 @@ class GitLabClient:
         }
         
         logger.info(
-            f"Adding user {username} (id: {user_id}) to group {group_id} "
-            f"with access level {access_level}"
+            "Adding user %s (id: %s) to group %s "
+            "with access level %s",
+            username, user_id, group_id, access_level
         )
         result = self._request(
             "POST",
             f"/groups/{group_id}/members",
             json_data=json_data
         )
-        logger.info(f"User added to group successfully: {result.get('id')}")
+        logger.info("User added to group successfully: %s", result.get('id'))
         return result
     
     def get_project(self, project_id: int) -> Dict[str, Any]:
@@ -170,9 +201,9 @@ class GitLabClient:
         Args:
             project_id: Fork relationship을 삭제할 프로젝트 ID
         """
-        logger.info(f"Deleting fork relationship for project {project_id}")
+        logger.info("Deleting fork relationship for project %s", project_id)
         self._request("DELETE", f"/projects/{project_id}/fork")
-        logger.info(f"Fork relationship deleted successfully for project {project_id}")
+        logger.info("Fork relationship deleted successfully for project %s", project_id)
     
     def protect_branch(
         self,
@@ -200,13 +231,14 @@ class GitLabClient:
         }
         
         logger.info(
-            f"Protecting branch {branch_name} for project {project_id} "
-            f"with push_access_level={push_access_level}, merge_access_level={merge_access_level}"
+            "Protecting branch %s for project %s "
+            "with push_access_level=%s, merge_access_level=%s",
+            branch_name, project_id, push_access_level, merge_access_level
         )
         result = self._request(
             "POST",
             f"/projects/{project_id}/protected_branches",
             json_data=json_data
         )
-        logger.info(f"Branch {branch_name} protected successfully for project {project_id}")
+        logger.info("Branch %s protected successfully for project %s", branch_name, project_id)
         return result
\ No newline at end of file
@@ -0,0 +1,101 @@
+import threading
+from typing import Dict, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# 호스트별 커넥션 풀 크기
+# 프로세스 수명 동안 클라이언트를 재사용하므로 keep-alive 커넥션을 넉넉하게 유지
+POOL_CONNECTIONS = 32
+POOL_MAXSIZE = 64
+
+# 모든 세션이 공유하는 HTTPAdapter (커넥션 풀)
+# GitLab 인스턴스/Jenkins 클라이언트가 달라도 같은 호스트로의 keep-alive 커넥션을 재사용
+_shared_adapter: Optional[HTTPAdapter] = None
+_adapter_lock = threading.Lock()
+
+
+def make_retry() -> Retry:
+    """
+    GitLab/Jenkins API 공통 재시도 전략 생성
+    
+    jitter를 적용한 지수 backoff로 여러 consumer가 동시에 재시도하는 것을 방지하고,
+    429 응답의 Retry-After 헤더를 따른다.
+    
+    POST(fork, 멤버 추가, Jenkins createItem)는 멱등하지 않으므로 재시도하지 않는다.
+    게이트웨이 오류나 read timeout 후 재전송하면 이미 생성된 리소스와 충돌(409)할 수 있다.
+    """
+    return Retry(
+        total=5,
+        backoff_factor=0.5,
+        backoff_max=30,
+        backoff_jitter=1.0,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=frozenset(["GET", "PUT", "DELETE", "HEAD", "OPTIONS"]),
+        respect_retry_after_header=True,
+        raise_on_status=False
+    )
+
+
+def get_adapter() -> HTTPAdapter:
+    """
+    공유 HTTPAdapter 반환 (최초 호출 시 생성)
+    
+    Returns:
+        재시도 전략과 커넥션 풀이 설정된 HTTPAdapter
+    """
+    global _shared_adapter
+    
+    adapter = _shared_adapter
+    if adapter is not None:
+        return adapter
+    
+    with _adapter_lock:
+        if _shared_adapter is None:
+            _shared_adapter = HTTPAdapter(
+                max_retries=make_retry(),
+                pool_connections=POOL_CONNECTIONS,
+                pool_maxsize=POOL_MAXSIZE,
+                pool_block=False
+            )
+        return _shared_adapter
+
+
+def close_adapter() -> None:
+    """공유 HTTPAdapter의 커넥션 풀 종료 (애플리케이션 종료 시 호출)"""
+    global _shared_adapter
+    
+    with _adapter_lock:
+        if _shared_adapter is not None:
+            _shared_adapter.close()
+            _shared_adapter = None
+
+
+def make_session(
+    headers: Optional[Dict[str, str]] = None,
+    auth: Optional[Tuple[str, str]] = None
+) -> requests.Session:
+    """
+    공유 커넥션 풀을 사용하는 requests.Session 생성
+    
+    세션을 close()하면 공유 커넥션 풀도 닫히므로 종료는 close_adapter()로 처리한다.
+    
+    Args:
+        headers: 세션 기본 헤더 (선택)
+        auth: Basic 인증 정보 (username, password) (선택)
+    
+    Returns:
+        requests.Session 인스턴스
+    """
+    session = requests.Session()
+    adapter = get_adapter()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    
+    if headers:
+        session.headers.update(headers)
+    if auth:
+        session.auth = auth
+    
+    return session
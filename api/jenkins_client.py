@@ -1,33 +1,50 @@
 import logging
+from functools import lru_cache
 from typing import Dict, Any, Optional
 
+import orjson
 import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
+
+from api.http import make_session
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=512)
+def _folder_to_endpoint(path: str) -> str:
+    """
+    폴더/프로젝트 경로를 Jenkins API 엔드포인트 형식으로 변환 (경로별로 캐싱)
+    
+    Args:
+        path: 폴더 또는 프로젝트 경로 (예: "/new/era/" 또는 "new/era/new-era-project")
+    
+    Returns:
+        Jenkins API 엔드포인트 (예: "/job/new/job/era"), 빈 경로면 ""
+    """
+    parts = tuple(p for p in path.strip('/').split('/') if p)
+    if not parts:
+        return ""
+    return '/' + '/'.join(f"job/{p}" for p in parts)
+
+
 class JenkinsClient:
-    def __init__(self, base_url: str, username: str, password: str, timeout: int = 30):
+    def __init__(
+        self,
+        base_url: str,
+        username: str,
+        password: str,
+        timeout: int = 30,
+        session: Optional[requests.Session] = None
+    ):
         self.base_url = base_url.rstrip('/')
         self.username = username
         self.password = password
         self.timeout = timeout
+        # Basic 인증 정보 (세션을 공유할 수 있도록 요청마다 전달, requests가 헤더 생성)
+        self._auth = (username, password)
         
-        # 세션 생성 및 재시도 전략 설정
-        self.session = requests.Session()
-        retry_strategy = Retry(
-            total=3,
-            backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504]
-        )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        self.session.mount("http://", adapter)
-        self.session.mount("https://", adapter)
-        
-        # Basic 인증 설정 (requests가 자동으로 헤더 생성)
-        self.session.auth = (username, password)
+        # 세션이 주어지면 공유하고, 없으면 공유 커넥션 풀을 사용하는 세션 생성
+        self.session = session or make_session()
     
     def _request(
         self,
@@ -38,7 +55,7 @@ class JenkinsClient:
         data: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """HTTP 요청 헬퍼 메서드"""
-        url = f"{self.base_url}{endpoint}"
+        url = self.base_url + endpoint
         
         try:
             response = self.session.request(
@@ -47,47 +64,28 @@ class JenkinsClient:
                 params=params,
                 json=json_data,
                 data=data,
+                auth=self._auth,
                 timeout=self.timeout
             )
             response.raise_for_status()
             # Jenkins API는 일부 엔드포인트에서 빈 응답을 반환할 수 있음
             if response.content:
                 try:
-                    return response.json()
-                except ValueError:
+                    return orjson.loads(response.content)
+                except orjson.JSONDecodeError:
                     # JSON이 아닌 경우 텍스트 반환
                     return {"content": response.text}
             return {}
         except requests.exceptions.RequestException as e:
-            logger.error(f"Jenkins API request failed: {method} {url}, error: {e}")
+            logger.error("Jenkins API request failed: %s %s, error: %s", method, url, e)
             raise
     
-    def _build_folder_endpoint(self, folder_path: str) -> str:
-        """
-        폴더 경로를 Jenkins API 엔드포인트 형식으로 변환
-        
-        Args:
-            folder_path: 폴더 경로 (예: "/new/era/" 또는 "new/era/")
-        
-        Returns:
-            Jenkins API 엔드포인트 (예: "/job/new/job/era")
-        """
-        # 앞뒤 슬래시 제거 및 빈 문자열 처리
-        path = folder_path.strip('/')
-        if not path:
-            return ""
-        
-        # 각 폴더를 /job/로 연결
-        folders = [f for f in path.split('/') if f]
-        endpoint = '/'.join([f"job/{folder}" for folder in folders])
-        
-        return f"/{endpoint}" if endpoint else ""
-    
     def copy_project(
         self,
         source_job_name: str,
         target_folder_path: str,
-        new_job_name: str
+        new_job_name: str,
+        fetch_info: bool = False
     ) -> Dict[str, Any]:
         """
         다른 폴더의 프로젝트를 복사하여 새 프로젝트 생성
@@ -96,15 +94,16 @@ class JenkinsClient:
             source_job_name: 복사할 원본 프로젝트 경로 (예: "/a/b/template" 또는 "a/b/template")
             target_folder_path: 생성할 폴더 경로 (예: "/new/era/" 또는 "new/era/")
             new_job_name: 생성할 새 프로젝트 이름 (예: "new-era-project")
+            fetch_info: True이면 생성 후 프로젝트 전체 정보를 추가로 조회
         
         Returns:
-            생성된 프로젝트 정보
+            생성된 프로젝트 정보 (기본: name, url, fullName)
         """
         # source_job_name에서 앞의 슬래시 제거
         source_path = source_job_name.lstrip('/')
         
         # 폴더 경로를 Jenkins API 엔드포인트 형식으로 변환
-        folder_endpoint = self._build_folder_endpoint(target_folder_path)
+        folder_endpoint = _folder_to_endpoint(target_folder_path)
         
         # 엔드포인트 구성: /job/new/job/era/createItem
         endpoint = f"{folder_endpoint}/createItem" if folder_endpoint else "/createItem"
@@ -118,14 +117,16 @@ class JenkinsClient:
         }
         
         logger.info(
-            f"Copying Jenkins project from '{source_job_name}' to "
-            f"'{target_folder_path}{new_job_name}'"
+            "Copying Jenkins project from '%s' to "
+            "'%s%s'",
+            source_job_name, target_folder_path, new_job_name
         )
         
         try:
             response = self.session.post(
                 f"{self.base_url}{endpoint}",
                 params=params,
+                auth=self._auth,
                 timeout=self.timeout,
                 allow_redirects=False
             )
@@ -135,18 +136,28 @@ class JenkinsClient:
                 # 최종 경로 구성
                 final_path = f"{target_folder_path.rstrip('/')}/{new_job_name}".lstrip('/')
                 logger.info(
-                    f"Jenkins project copied successfully: "
-                    f"source='{source_job_name}', new='{final_path}'"
+                    "Jenkins project copied successfully: "
+                    "source='%s', new='%s'",
+                    source_job_name, final_path
                 )
-                # 새 프로젝트 정보 조회
-                return self.get_project(final_path)
+                if fetch_info:
+                    # 새 프로젝트 정보 조회
+                    return self.get_project(final_path)
+                # 경로로 job URL을 구성하여 최소 정보 반환
+                # (createItem의 Location 헤더는 job URL이 아닌 .../configure를 가리키고 200 응답에는 없음)
+                return {
+                    "name": new_job_name,
+                    "url": f"{self.base_url}{_folder_to_endpoint(final_path)}/",
+                    "fullName": final_path
+                }
             else:
                 response.raise_for_status()
         except requests.exceptions.RequestException as e:
             logger.error(
-                f"Failed to copy Jenkins project: "
-                f"source='{source_job_name}', target_folder='{target_folder_path}', "
-                f"new_job='{new_job_name}', error={e}"
+                "Failed to copy Jenkins project: "
+                "source='%s', target_folder='%s', "
+                "new_job='%s', error=%s",
+                source_job_name, target_folder_path, new_job_name, e
             )
             raise
     
@@ -160,18 +171,13 @@ class JenkinsClient:
         Returns:
             프로젝트 정보
         """
-        # 앞의 슬래시 제거
-        path = job_path.lstrip('/')
-        
         # 각 경로 요소를 /job/로 연결
         # 예: "new/era/new-era-project" -> "/job/new/job/era/job/new-era-project"
-        parts = [f for f in path.split('/') if f]
-        endpoint = '/'.join([f"job/{part}" for part in parts])
-        endpoint = f"/{endpoint}/api/json"
+        endpoint = f"{_folder_to_endpoint(job_path)}/api/json"
         
-        logger.info(f"Getting Jenkins project info: {job_path}")
+        logger.info("Getting Jenkins project info: %s", job_path)
         result = self._request("GET", endpoint)
-        logger.info(f"Jenkins project info retrieved: {job_path}")
+        logger.info("Jenkins project info retrieved: %s", job_path)
         return result
     
     def project_exists(self, job_name: str) -> bool:
@@ -184,6 +190,33 @@ class JenkinsClient:
         Returns:
             존재 여부
         """
+        # 본문이 필요 없으므로 job 루트에 HEAD 요청으로 존재 여부만 확인
+        url = f"{self.base_url}{_folder_to_endpoint(job_name)}/"
+        try:
+            response = self.session.head(
+                url,
+                auth=self._auth,
+                allow_redirects=False,
+                timeout=self.timeout
+            )
+            if response.status_code == 405 or 300 <= response.status_code < 400:
+                # HEAD를 허용하지 않거나 리다이렉트(http->https, 프록시 등)되는 경우
+                # 리다이렉트를 따라가는 GET으로 확인 (3xx를 존재하지 않음으로 판단하지 않음)
+                logger.info(
+                    "HEAD returned %s for Jenkins project, falling back to GET: %s",
+                    response.status_code, job_name
+                )
+                return self._project_exists_by_get(job_name)
+            if response.status_code == 404:
+                return False
+            response.raise_for_status()
+            return response.status_code == 200
+        except requests.exceptions.RequestException as e:
+            logger.error("Jenkins API request failed: HEAD %s, error: %s", url, e)
+            raise
+    
+    def _project_exists_by_get(self, job_name: str) -> bool:
+        """프로젝트 정보(/api/json) 조회로 존재 여부 확인"""
         try:
             self.get_project(job_name)
             return True
@@ -1,12 +1,18 @@
 import logging
 import os
 from typing import Optional
-from dotenv import load_dotenv
-
-load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# 하위 호환성: 기존 방식의 GitLab 인스턴스 환경변수
+# gitType -> (URL 환경변수, TOKEN 환경변수, 기본 URL)
+_LEGACY_INSTANCES = {
+    "GitlabAi": ("GITLAB_AI_URL", "GITLAB_AI_TOKEN", None),
+    "GitlabOnprem": ("GITLAB_ONPREM_URL", "GITLAB_ONPREM_TOKEN", None),
+    "Gitlab": ("GITLAB_URL", "GITLAB_TOKEN", "https://gitlab.com"),
+    "GitlabTest": ("GITLAB_TEST_URL", "GITLAB_TEST_TOKEN", None),
+}
+
 
 class Config:
     def __init__(self):
@@ -20,7 +26,10 @@ class Config:
         self.consume_binding_key = os.getenv("CONSUME_BINDING_KEY", os.getenv("BINDING_KEY", ""))
         
         # Consumer 설정
-        self.prefetch_count = int(os.getenv("PREFETCH_COUNT", "20"))
+        self.prefetch_count = int(os.getenv("PREFETCH_COUNT", "100"))
+        # 메시지 핸들러 스레드 수 (기본값: 4)
+        # 2 이상이면 메시지가 병렬로 처리되어 같은 프로젝트/그룹 메시지의 처리 순서가 보장되지 않음
+        self.handler_workers = int(os.getenv("HANDLER_WORKERS", "4"))
         self.service_name = os.getenv("SERVICE_NAME", "solgit-project-module")
         
         # GitLab API 설정 (기본)
@@ -55,50 +64,24 @@ class Config:
                 else:
                     # 환경변수가 없으면 경고 (하지만 계속 진행)
                     logger.warning(
-                        f"GitLab instance '{instance_name}' configured in GITLAB_INSTANCES "
-                        f"but missing {url_key} or {token_key}"
+                        "GitLab instance '%s' configured in GITLAB_INSTANCES "
+                        "but missing %s or %s",
+                        instance_name, url_key, token_key
                     )
         
-        # 하위 호환성: 기존 방식도 지원 (GITLAB_INSTANCES가 없을 때)
-        # GitlabAi 설정 (하위 호환성)
-        gitlab_ai_url = os.getenv("GITLAB_AI_URL")
-        gitlab_ai_token = os.getenv("GITLAB_AI_TOKEN")
-        if gitlab_ai_url and gitlab_ai_token and "GitlabAi" not in self.gitlab_configs:
-            self.gitlab_configs["GitlabAi"] = {
-                "url": gitlab_ai_url,
-                "token": gitlab_ai_token,
-                "timeout": self.gitlab_timeout
-            }
-        
-        # GitlabOnprem 설정 (하위 호환성)
-        gitlab_onprem_url = os.getenv("GITLAB_ONPREM_URL")
-        gitlab_onprem_token = os.getenv("GITLAB_ONPREM_TOKEN")
-        if gitlab_onprem_url and gitlab_onprem_token and "GitlabOnprem" not in self.gitlab_configs:
-            self.gitlab_configs["GitlabOnprem"] = {
-                "url": gitlab_onprem_url,
-                "token": gitlab_onprem_token,
-                "timeout": self.gitlab_timeout
-            }
-        
-        # Gitlab 설정 (기본, 하위 호환성)
-        gitlab_url = os.getenv("GITLAB_URL", "https://gitlab.com")
-        gitlab_token = os.getenv("GITLAB_TOKEN")
-        if gitlab_token and "Gitlab" not in self.gitlab_configs:
-            self.gitlab_configs["Gitlab"] = {
-                "url": gitlab_url,
-                "token": gitlab_token,
-                "timeout": self.gitlab_timeout
-            }
-        
-        # GitlabTest 설정 (하위 호환성)
-        gitlab_test_url = os.getenv("GITLAB_TEST_URL")
-        gitlab_test_token = os.getenv("GITLAB_TEST_TOKEN")
-        if gitlab_test_url and gitlab_test_token and "GitlabTest" not in self.gitlab_configs:
-            self.gitlab_configs["GitlabTest"] = {
-                "url": gitlab_test_url,
-                "token": gitlab_test_token,
-                "timeout": self.gitlab_timeout
-            }
+        # 하위 호환성: 기존 방식도 지원 (GITLAB_INSTANCES에 없는 인스턴스만)
+        for instance_name, (url_key, token_key, default_url) in _LEGACY_INSTANCES.items():
+            if instance_name in self.gitlab_configs:
+                continue
+            
+            url = os.getenv(url_key, default_url)
+            token = os.getenv(token_key)
+            if url and token:
+                self.gitlab_configs[instance_name] = {
+                    "url": url,
+                    "token": token,
+                    "timeout": self.gitlab_timeout
+                }
         
         # Jenkins API 설정
         self.jenkins_timeout = int(os.getenv("JENKINS_TIMEOUT", "30"))
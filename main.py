@@ -1,14 +1,11 @@
 import logging
 import signal
-import sys
+import threading
 from typing import Optional
 
-import sys
-import os
-
-# 프로젝트 루트를 Python path에 추가
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from dotenv import load_dotenv
 
+from api.http import close_adapter
 from config import get_config
 from mq.subscriber import Subscriber
 from service.message_service import MessageService
@@ -26,11 +23,13 @@ class Application:
         self.config = get_config()
         self.subscriber: Optional[Subscriber] = None
         self.running = False
+        self._stop_event = threading.Event()
         
         # GitLab 설정 로드 확인
         if self.config.gitlab_configs:
             logger.info(
-                f"GitLab configurations loaded: {list(self.config.gitlab_configs.keys())}"
+                "GitLab configurations loaded: %s",
+                list(self.config.gitlab_configs.keys())
             )
         else:
             logger.warning(
@@ -51,41 +50,42 @@ class Application:
             queue_name=self.config.consume_queue_name,
             binding_key=self.config.consume_binding_key,
             prefetch_count=self.config.prefetch_count,
-            message_handler=self.message_service.handle_message
+            message_handler=self.message_service.handle_message,
+            handler_workers=self.config.handler_workers
         )
-        
-        # 시그널 핸들러 등록
-        signal.signal(signal.SIGINT, self._signal_handler)
-        signal.signal(signal.SIGTERM, self._signal_handler)
     
     def _signal_handler(self, signum, frame):
         """시그널 핸들러"""
-        logger.info(f"Received signal {signum}, shutting down...")
+        logger.info("Received signal %s, shutting down...", signum)
+        self._stop_event.set()
         self.stop()
-        sys.exit(0)
     
     def start(self):
         """애플리케이션 시작"""
+        # 시그널 핸들러 등록 (메인 스레드에서만 가능)
+        if threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGINT, self._signal_handler)
+            signal.signal(signal.SIGTERM, self._signal_handler)
+        
         logger.info(
-            f"Starting service - {self.config.service_name}, "
-            f"queue={self.config.consume_queue_name}, "
-            f"exchange={self.config.consume_exchange_name}"
+            "Starting service - %s, "
+            "queue=%s, "
+            "exchange=%s",
+            self.config.service_name, self.config.consume_queue_name, self.config.consume_exchange_name
         )
         
         try:
             self.running = True
             self.subscriber.start()
             
-            # 메인 스레드에서 대기
+            # 메인 스레드에서 중지 요청까지 대기
             logger.info("Service started, waiting for messages...")
-            while self.running:
-                import time
-                time.sleep(1)
+            self._stop_event.wait()
                 
         except KeyboardInterrupt:
             logger.info("Received keyboard interrupt")
         except Exception as e:
-            logger.error(f"Error in main loop: {e}", exc_info=True)
+            logger.error("Error in main loop: %s", e, exc_info=True)
         finally:
             self.stop()
     
@@ -96,14 +96,23 @@ class Application:
         
         logger.info("Stopping service...")
         self.running = False
+        self._stop_event.set()
         
         if self.subscriber:
             self.subscriber.stop()
         
+        # 큐에 남은 Backend API 발행 처리 후 종료
+        self.message_service.close()
+        
+        # 공유 HTTP 커넥션 풀 종료
+        close_adapter()
+        
         logger.info("Service stopped")
 
 
 def main():
+    # .env 파일은 애플리케이션 진입점에서 한 번만 로드
+    load_dotenv()
     app = Application()
     app.start()
 
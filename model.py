@@ -1,32 +1,85 @@
-from datetime import datetime
+import random
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from types import MappingProxyType
 from typing import Any, Dict, Optional
-from uuid import uuid4
+from uuid import UUID
 
+import orjson
 
+# header/body가 없는 메시지용 기본값 (호출마다 빈 dict를 새로 만들지 않도록 공유)
+_EMPTY: Dict[str, Any] = MappingProxyType({})
+
+# 이 값보다 큰 epoch 타임스탬프는 밀리초 단위로 간주 (초 단위라면 5138년 이후)
+_EPOCH_MS_THRESHOLD = 100_000_000_000
+
+
+def _uuid7() -> str:
+    """
+    UUIDv7 문자열 생성 (RFC 9562)
+    
+    48bit ms 타임스탬프 + 74bit 난수로 구성되어 시간순 정렬이 가능하다.
+    message_id는 보안 토큰이 아니므로 OS CSPRNG 대신 random 모듈을 사용한다.
+    """
+    unix_ts_ms = time.time_ns() // 1_000_000
+    rand = random.getrandbits(74)
+    value = (
+        (unix_ts_ms & 0xFFFF_FFFF_FFFF) << 80
+        | 0x7 << 76                         # version 7
+        | (rand >> 62) << 64                # rand_a (12bit)
+        | 0b10 << 62                        # variant
+        | (rand & 0x3FFF_FFFF_FFFF_FFFF)    # rand_b (62bit)
+    )
+    return str(UUID(int=value))
+
+
+def _from_epoch(value: float) -> datetime:
+    """
+    epoch 숫자 타임스탬프를 UTC datetime으로 변환
+    
+    밀리초 단위로 보이는 값은 초로 변환하고, 범위를 벗어난 값은 현재 시각으로 대체한다.
+    """
+    if value > _EPOCH_MS_THRESHOLD:
+        value = value / 1000
+    try:
+        return datetime.fromtimestamp(value, timezone.utc)
+    except (OverflowError, OSError, ValueError):
+        return datetime.now(timezone.utc)
+
+
+@dataclass(slots=True)
 class MessageHeader:
-    def __init__(
-        self,
-        message_id: str,
-        message_type: str,
-        version: str = "v1",
-        timestamp: Optional[datetime] = None,
-        correlation_id: Optional[str] = None,
-        source: Optional[str] = None
-    ):
-        self.message_id = message_id
-        self.message_type = message_type
-        self.version = version
-        self.timestamp = timestamp or datetime.utcnow()
-        self.correlation_id = correlation_id
-        self.source = source
+    message_id: str
+    message_type: str
+    version: str = "v1"
+    timestamp: Optional[datetime] = None
+    correlation_id: Optional[str] = None
+    source: Optional[str] = None
+    # to_dict()에서 사용하는 ISO 문자열 캐시 (최초 직렬화 시 생성)
+    _iso: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self.timestamp = self._to_utc(self.timestamp or datetime.now(timezone.utc))
+    
+    @staticmethod
+    def _to_utc(timestamp: datetime) -> datetime:
+        """timezone 정보가 없는 datetime은 UTC로 간주하여 UTC aware datetime으로 변환"""
+        if timestamp.tzinfo is None:
+            return timestamp.replace(tzinfo=timezone.utc)
+        return timestamp.astimezone(timezone.utc)
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "MessageHeader":
         timestamp = data.get("timestamp")
         if isinstance(timestamp, str):
-            timestamp = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
-        elif timestamp is None:
-            timestamp = datetime.utcnow()
+            # Python 3.11부터 fromisoformat이 "Z" 접미사를 직접 지원
+            timestamp = datetime.fromisoformat(timestamp)
+        elif isinstance(timestamp, (int, float)) and not isinstance(timestamp, bool):
+            timestamp = _from_epoch(timestamp)
+        else:
+            # 없거나 해석할 수 없는 형식이면 수신 시각 사용 (메시지 처리는 계속)
+            timestamp = datetime.now(timezone.utc)
         
         return cls(
             message_id=data.get("messageId", ""),
@@ -38,19 +91,21 @@ class MessageHeader:
         )
     
     def to_dict(self) -> Dict[str, Any]:
+        if self._iso is None:
+            self._iso = self.timestamp.isoformat().replace("+00:00", "Z")
         return {
             "messageId": self.message_id,
             "messageType": self.message_type,
             "version": self.version,
-            "timestamp": self.timestamp.isoformat() + "Z",
+            "timestamp": self._iso,
             "correlationId": self.correlation_id,
             "source": self.source
         }
 
 
+@dataclass(slots=True)
 class MessageBody:
-    def __init__(self, payload: Any):
-        self.payload = payload
+    payload: Any
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "MessageBody":
@@ -60,18 +115,25 @@ class MessageBody:
         return {"payload": self.payload}
 
 
+@dataclass(slots=True)
 class Message:
-    def __init__(self, header: MessageHeader, body: MessageBody):
-        self.header = header
-        self.body = body
+    header: MessageHeader
+    body: MessageBody
+    # to_bytes() 직렬화 결과 캐시 (재발행/재시도 시 재직렬화 방지)
+    _cached_bytes: Optional[bytes] = field(default=None, init=False, repr=False, compare=False)
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Message":
         return cls(
-            header=MessageHeader.from_dict(data.get("header", {})),
-            body=MessageBody.from_dict(data.get("body", {}))
+            header=MessageHeader.from_dict(data.get("header") or _EMPTY),
+            body=MessageBody.from_dict(data.get("body") or _EMPTY)
         )
     
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "Message":
+        """JSON bytes를 Message로 변환 (UTF-8 decode 없이 orjson으로 바로 파싱)"""
+        return cls.from_dict(orjson.loads(data))
+    
     @classmethod
     def new_message(
         cls,
@@ -82,10 +144,10 @@ class Message:
     ) -> "Message":
         return cls(
             header=MessageHeader(
-                message_id=str(uuid4()),
+                message_id=_uuid7(),
                 message_type=message_type,
                 version="v1",
-                timestamp=datetime.utcnow(),
+                timestamp=datetime.now(timezone.utc),
                 correlation_id=correlation_id,
                 source=source
             ),
@@ -97,3 +159,41 @@ class Message:
             "header": self.header.to_dict(),
             "body": self.body.to_dict()
         }
+    
+    def to_bytes(self) -> bytes:
+        """
+        Message를 JSON bytes로 직렬화 (to_dict()를 거치지 않고 orjson으로 직접 직렬화)
+        
+        결과는 캐싱되므로 header/body를 변경한 경우 invalidate_cache()를 호출해야 한다.
+        """
+        if self._cached_bytes is None:
+            self._cached_bytes = orjson.dumps(
+                self,
+                default=_default,
+                option=orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_UTC_Z
+            )
+        return self._cached_bytes
+    
+    def invalidate_cache(self) -> None:
+        """직렬화 캐시 초기화"""
+        self._cached_bytes = None
+        self.header._iso = None
+
+
+def _default(obj: Any) -> Any:
+    """orjson 직렬화 시 메시지 모델을 wire 포맷(camelCase)으로 변환"""
+    if isinstance(obj, Message):
+        return {"header": obj.header, "body": obj.body}
+    if isinstance(obj, MessageHeader):
+        # timestamp는 orjson이 직접 ISO 8601(Z)로 직렬화
+        return {
+            "messageId": obj.message_id,
+            "messageType": obj.message_type,
+            "version": obj.version,
+            "timestamp": obj.timestamp,
+            "correlationId": obj.correlation_id,
+            "source": obj.source
+        }
+    if isinstance(obj, MessageBody):
+        return {"payload": obj.payload}
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
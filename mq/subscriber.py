@@ -1,21 +1,16 @@
-import json
+import itertools
 import logging
 import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import contextmanager
+from functools import partial
 from typing import Callable, Optional
 
+import orjson
 import pika
 from pika.exceptions import AMQPConnectionError, AMQPChannelError
 
-import sys
-import os
-
-# 프로젝트 루트를 Python path에 추가
-project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-if project_root not in sys.path:
-    sys.path.insert(0, project_root)
-
 from model import Message
 
 
@@ -23,6 +18,13 @@ logger = logging.getLogger(__name__)
 
 
 class Subscriber:
+    # 재연결 대기 시간 범위 (초)
+    RECONNECT_DELAY_MIN = 1
+    RECONNECT_DELAY_MAX = 30
+    # 메시지 핸들러 스레드 수 기본값
+    # fork 1건이 최대 3개의 GitLab 요청을 동시에 보내므로 공유 커넥션 풀(POOL_MAXSIZE) 이내로 유지
+    DEFAULT_HANDLER_WORKERS = 4
+    
     def __init__(
         self,
         rabbitmq_url: str,
@@ -31,7 +33,8 @@ class Subscriber:
         queue_name: str,
         binding_key: str,
         prefetch_count: int,
-        message_handler: Callable[[dict, Message], None]
+        message_handler: Callable[[int, Message], None],
+        handler_workers: Optional[int] = None
     ):
         self.rabbitmq_url = rabbitmq_url
         self.exchange_name = exchange_name
@@ -40,12 +43,27 @@ class Subscriber:
         self.binding_key = binding_key or "#"  # 빈 값이면 모든 메시지 수신
         self.prefetch_count = prefetch_count
         self.message_handler = message_handler
+        # 메시지 핸들러 실행 스레드 수 (2 이상이면 메시지 처리 순서가 보장되지 않음)
+        self.handler_workers = handler_workers or self.DEFAULT_HANDLER_WORKERS
+        self._executor: Optional[ThreadPoolExecutor] = None
         
         self.connection: Optional[pika.BlockingConnection] = None
         self.channel: Optional[pika.channel.Channel] = None
         self.workers: list[threading.Thread] = []
         self.running = False
         self._lock = threading.Lock()
+        
+        # ACK 배치 처리 설정 (성공한 메시지는 모아서 multiple=True로 ACK)
+        # 아래 상태는 I/O 스레드(Worker 0)에서만 변경
+        self.ack_batch_size = prefetch_count // 2 or 1
+        self.ack_flush_interval = 0.1
+        self._outstanding_tags: set[int] = set()  # 핸들러 처리 중인 delivery tag
+        self._completed_tags: set[int] = set()    # 처리 성공, ACK 대기 중인 delivery tag
+        self._ack_flush_scheduled = False
+        
+        # 에러 로그 traceback 샘플링 (100건 중 1건만 traceback 포함)
+        # 장애 시 에러가 폭증해도 traceback 포맷팅 비용이 CPU를 점유하지 않도록 함
+        self._error_sampler = itertools.cycle(range(100))
     
     def connect(self):
         """RabbitMQ 연결 및 Exchange, Queue 설정"""
@@ -55,6 +73,11 @@ class Subscriber:
             )
             self.channel = self.connection.channel()
             
+            # 이전 채널의 delivery tag는 새 채널에서 유효하지 않으므로 초기화
+            self._outstanding_tags.clear()
+            self._completed_tags.clear()
+            self._ack_flush_scheduled = False
+            
             # Exchange 선언
             self.channel.exchange_declare(
                 exchange=self.exchange_name,
@@ -62,7 +85,8 @@ class Subscriber:
                 durable=True
             )
             logger.info(
-                f"Exchange declared: {self.exchange_name} (type: {self.exchange_type})"
+                "Exchange declared: %s (type: %s)",
+                self.exchange_name, self.exchange_type
             )
             
             # Queue 선언
@@ -70,7 +94,7 @@ class Subscriber:
                 queue=self.queue_name,
                 durable=True
             )
-            logger.info(f"Queue declared: {self.queue_name}")
+            logger.info("Queue declared: %s", self.queue_name)
             
             # Queue를 Exchange에 바인딩
             self.channel.queue_bind(
@@ -79,15 +103,23 @@ class Subscriber:
                 routing_key=self.binding_key
             )
             logger.info(
-                f"Queue bound to exchange: {self.queue_name} -> {self.exchange_name} "
-                f"(binding_key: {self.binding_key})"
+                "Queue bound to exchange: %s -> %s "
+                "(binding_key: %s)",
+                self.queue_name, self.exchange_name, self.binding_key
             )
             
             # QoS 설정
             self.channel.basic_qos(prefetch_count=self.prefetch_count)
             
+            # Push 방식 소비 등록 (broker가 prefetch 범위 내에서 메시지를 전달)
+            self.channel.basic_consume(
+                queue=self.queue_name,
+                on_message_callback=self._on_message,
+                auto_ack=False
+            )
+            
         except (AMQPConnectionError, AMQPChannelError) as e:
-            logger.error(f"Failed to connect to RabbitMQ: {e}")
+            logger.error("Failed to connect to RabbitMQ: %s", e)
             raise
     
     def start(self, num_workers: int = 1):
@@ -101,7 +133,13 @@ class Subscriber:
         
         self.running = True
         
-        # 단일 Worker 스레드만 사용 (병렬 처리 방지)
+        # 메시지 핸들러 실행용 스레드 풀
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.handler_workers,
+            thread_name_prefix="message-handler"
+        )
+        
+        # RabbitMQ I/O는 단일 Worker 스레드에서만 처리 (pika 연결은 thread-safe하지 않음)
         worker = threading.Thread(
             target=self._worker,
             args=(0,),
@@ -112,99 +150,198 @@ class Subscriber:
         logger.info("Worker 0 started (single worker mode)")
         
         logger.info(
-            f"Subscriber started: queue={self.queue_name}, "
-            f"exchange={self.exchange_name}, workers=1"
+            "Subscriber started: queue=%s, "
+            "exchange=%s, workers=1, "
+            "handler_workers=%s",
+            self.queue_name, self.exchange_name, self.handler_workers
         )
     
     def _worker(self, worker_id: int):
         """Worker 스레드 메인 루프"""
+        # 재연결 대기 시간 (연속 실패 시 지수적으로 증가, 연결 성공 시 초기화)
+        reconnect_delay = self.RECONNECT_DELAY_MIN
         while self.running:
             try:
                 if not self.connection or self.connection.is_closed:
-                    logger.warning(f"Worker {worker_id}: Connection closed, reconnecting...")
+                    logger.warning("Worker %s: Connection closed, reconnecting...", worker_id)
                     self.connect()
                 
-                # 메시지 소비
-                method_frame, header_frame, body = self.channel.basic_get(
-                    queue=self.queue_name,
-                    auto_ack=False
-                )
-                
-                if method_frame:
-                    self._process_message(worker_id, method_frame, header_frame, body)
-                else:
-                    # 메시지가 없으면 잠시 대기
-                    time.sleep(0.1)
+                # 전달된 메시지 처리 (_on_message 콜백 호출)
+                # running 플래그를 확인할 수 있도록 최대 1초 단위로 반환
+                self.connection.process_data_events(time_limit=1)
+                reconnect_delay = self.RECONNECT_DELAY_MIN
                     
             except (AMQPConnectionError, AMQPChannelError) as e:
-                logger.error(f"Worker {worker_id}: Connection error: {e}")
-                time.sleep(5)  # 재연결 전 대기
+                logger.error(
+                    "Worker %s: Connection error: %s (retry in %ss)",
+                    worker_id, e, reconnect_delay
+                )
+                time.sleep(reconnect_delay)  # 재연결 전 대기
+                reconnect_delay = min(reconnect_delay * 2, self.RECONNECT_DELAY_MAX)
                 try:
                     self.connect()
                 except Exception as reconnect_error:
-                    logger.error(f"Worker {worker_id}: Reconnection failed: {reconnect_error}")
+                    logger.error("Worker %s: Reconnection failed: %s", worker_id, reconnect_error)
             except Exception as e:
-                logger.error(f"Worker {worker_id}: Unexpected error: {e}", exc_info=True)
+                logger.error("Worker %s: Unexpected error: %s", worker_id, e, exc_info=True)
                 time.sleep(1)
     
-    def _process_message(self, worker_id: int, method_frame, header_frame, body: bytes):
-        """메시지 처리"""
+    def _on_message(self, channel, method_frame, header_frame, body: bytes):
+        """basic_consume 메시지 수신 콜백 (Worker 0 스레드에서 호출)"""
+        self._process_message(0, channel, method_frame, header_frame, body)
+    
+    def _process_message(self, worker_id: int, channel, method_frame, header_frame, body: bytes):
+        """메시지 파싱 후 핸들러를 스레드 풀에 제출 (I/O 스레드에서 실행)"""
+        delivery_tag = method_frame.delivery_tag
         try:
-            # JSON 파싱
-            message_dict = json.loads(body.decode('utf-8'))
-            message = Message.from_dict(message_dict)
+            # JSON 파싱 (UTF-8 decode 없이 bytes를 바로 파싱)
+            message = Message.from_bytes(body)
+            header = message.header
+            message_id = header.message_id
             
             logger.info(
-                f"Worker {worker_id}: Message received - "
-                f"messageId={message.header.message_id}, "
-                f"messageType={message.header.message_type}, "
-                f"correlationId={message.header.correlation_id}"
+                "Worker %s: Message received - "
+                "messageId=%s, "
+                "messageType=%s, "
+                "correlationId=%s",
+                worker_id, message_id, header.message_type, header.correlation_id
             )
             
-            # 메시지 핸들러 호출
-            try:
-                self.message_handler(
-                    {
-                        "message_id": message.header.message_id,
-                        "correlation_id": message.header.correlation_id,
-                        "worker_id": worker_id
-                    },
-                    message
-                )
-                # 성공 시 ACK
-                self.channel.basic_ack(delivery_tag=method_frame.delivery_tag)
-                logger.info(
-                    f"Worker {worker_id}: Message processed successfully - "
-                    f"messageId={message.header.message_id}"
-                )
-            except Exception as handler_error:
-                logger.error(
-                    f"Worker {worker_id}: Message handler failed - "
-                    f"messageId={message.header.message_id}, error={handler_error}",
-                    exc_info=True
-                )
-                # 실패 시 NACK (requeue=False)
-                self.channel.basic_nack(
-                    delivery_tag=method_frame.delivery_tag,
-                    requeue=False
-                )
+            # 메시지 핸들러는 스레드 풀에서 실행하여 I/O 스레드가 다음 메시지를 계속 수신하도록 함
+            self._outstanding_tags.add(delivery_tag)
+            future = self._executor.submit(self.message_handler, worker_id, message)
+            future.add_done_callback(
+                partial(self._on_handler_done, worker_id, self.connection, channel, delivery_tag, message)
+            )
                 
-        except json.JSONDecodeError as e:
-            logger.error(f"Worker {worker_id}: Failed to parse message: {e}")
-            self.channel.basic_nack(
-                delivery_tag=method_frame.delivery_tag,
+        except orjson.JSONDecodeError as e:
+            logger.error("Worker %s: Failed to parse message: %s", worker_id, e)
+            channel.basic_nack(
+                delivery_tag=delivery_tag,
                 requeue=False
             )
         except Exception as e:
             logger.error(
-                f"Worker {worker_id}: Unexpected error processing message: {e}",
-                exc_info=True
+                "Worker %s: Unexpected error processing message: %s",
+                worker_id, e,
+                exc_info=next(self._error_sampler) == 0
             )
-            self.channel.basic_nack(
-                delivery_tag=method_frame.delivery_tag,
+            self._outstanding_tags.discard(delivery_tag)
+            channel.basic_nack(
+                delivery_tag=delivery_tag,
                 requeue=False
             )
     
+    def _on_handler_done(
+        self,
+        worker_id: int,
+        connection: pika.BlockingConnection,
+        channel,
+        delivery_tag: int,
+        message: Message,
+        future: Future
+    ):
+        """메시지 핸들러 완료 콜백 (핸들러 스레드에서 호출)"""
+        message_id = message.header.message_id
+        if future.cancelled():
+            # 종료 시 실행 전 취소된 메시지는 ACK/NACK 없이 두어 broker가 재전달하도록 함
+            logger.info(
+                "Worker %s: Message cancelled before processing, left for redelivery - "
+                "messageId=%s",
+                worker_id, message_id
+            )
+            return
+        handler_error = future.exception()
+        if handler_error is None:
+            logger.info(
+                "Worker %s: Message processed successfully - "
+                "messageId=%s",
+                worker_id, message_id
+            )
+        else:
+            logger.error(
+                "Worker %s: Message handler failed - "
+                "messageId=%s, error=%s",
+                worker_id, message_id, handler_error,
+                exc_info=handler_error if next(self._error_sampler) == 0 else None
+            )
+        
+        # pika 채널은 thread-safe하지 않으므로 ACK/NACK은 I/O 스레드에서 처리
+        try:
+            connection.add_callback_threadsafe(
+                partial(self._settle, channel, delivery_tag, handler_error is None)
+            )
+        except Exception as e:
+            # 연결이 이미 종료된 경우 broker가 메시지를 재전달
+            logger.warning(
+                "Worker %s: Failed to schedule ack - "
+                "messageId=%s, error=%s",
+                worker_id, message_id, e
+            )
+    
+    def _settle(self, channel, delivery_tag: int, success: bool):
+        """핸들러 결과에 따라 ACK 예약 또는 NACK (I/O 스레드에서 호출)"""
+        if channel is not self.channel or channel.is_closed:
+            # 재연결 이전 채널의 delivery tag는 무효 (broker가 재전달)
+            return
+        
+        self._outstanding_tags.discard(delivery_tag)
+        if success:
+            # 성공 시 ACK (배치 처리)
+            self._ack(channel, delivery_tag)
+        else:
+            # 실패 시 NACK (requeue=False)
+            channel.basic_nack(
+                delivery_tag=delivery_tag,
+                requeue=False
+            )
+    
+    def _ack(self, channel, delivery_tag: int):
+        """
+        성공한 메시지 ACK 예약
+        
+        ack_batch_size개가 모이면 즉시, 그렇지 않으면 ack_flush_interval 후에
+        multiple=True로 한 번에 ACK한다.
+        NACK은 배치하지 않고 메시지마다 즉시 처리한다.
+        """
+        self._completed_tags.add(delivery_tag)
+        
+        if len(self._completed_tags) >= self.ack_batch_size:
+            self._flush_acks(channel)
+        elif not self._ack_flush_scheduled:
+            self._ack_flush_scheduled = True
+            self.connection.call_later(self.ack_flush_interval, self._flush_acks)
+    
+    def _flush_acks(self, channel=None):
+        """
+        대기 중인 ACK를 multiple=True로 전송
+        
+        핸들러가 병렬로 실행되어 완료 순서가 delivery tag 순서와 다를 수 있으므로,
+        아직 처리 중인 가장 작은 tag보다 작은 완료 tag까지만 ACK한다.
+        """
+        self._ack_flush_scheduled = False
+        if not self._completed_tags:
+            return
+        
+        channel = channel or self.channel
+        if channel is None or channel.is_closed:
+            return
+        
+        if self._outstanding_tags:
+            floor = min(self._outstanding_tags)
+            ackable = [tag for tag in self._completed_tags if tag < floor]
+        else:
+            ackable = list(self._completed_tags)
+        
+        if ackable:
+            channel.basic_ack(delivery_tag=max(ackable), multiple=True)
+            self._completed_tags.difference_update(ackable)
+        
+        if self._completed_tags and not self._ack_flush_scheduled:
+            # 처리 중인 메시지 때문에 남은 ACK는 다음 주기에 다시 시도
+            self._ack_flush_scheduled = True
+            self.connection.call_later(self.ack_flush_interval, self._flush_acks)
+    
     def stop(self):
         """Subscriber 중지"""
         logger.info("Stopping subscriber...")
@@ -214,8 +351,20 @@ class Subscriber:
         for worker in self.workers:
             worker.join(timeout=5)
         
-        # 연결 종료
+        # 실행 중인 메시지 핸들러만 완료 대기하고, 아직 시작하지 않은 메시지는 취소
+        # (대기 중 heartbeat가 처리되지 않으므로 prefetch된 메시지 전체를 처리하지 않음)
+        # 취소된 메시지는 ACK하지 않으므로 연결 종료 후 broker가 재전달
+        if self._executor:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+        
+        # 핸들러가 예약한 ACK/NACK 처리 및 대기 중인 ACK 전송 후 연결 종료
         if self.channel and not self.channel.is_closed:
+            try:
+                self.connection.process_data_events(time_limit=0)
+                self._flush_acks()
+            except (AMQPConnectionError, AMQPChannelError) as e:
+                logger.warning("Failed to flush pending acks: %s", e)
             self.channel.close()
         if self.connection and not self.connection.is_closed:
             self.connection.close()
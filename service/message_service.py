@@ -1,22 +1,325 @@
+import itertools
 import logging
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 from typing import Dict, Any, Optional, List
 from datetime import datetime
 
-import sys
-import os
+import orjson
 import requests
-
-# 프로젝트 루트를 Python path에 추가
-project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-if project_root not in sys.path:
-    sys.path.insert(0, project_root)
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from api.gitlab_client import GitLabClient
+from api.http import make_session
 from api.jenkins_client import JenkinsClient
 from model import Message
 
 logger = logging.getLogger(__name__)
 
+# 멤버 추가 GitLab API 병렬 호출용 스레드 풀 (메시지마다 풀을 새로 만들지 않도록 공유)
+_MEMBER_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="gitlab-member")
+
+# Backend API 발행 요청 공통 헤더
+_HEADERS = {"Content-Type": "application/json"}
+
+# Backend API 발행 요청 본문의 고정 필드 (messageType별)
+_PU_ENV = {"routingKey": "support.update", "messageType": "PROJECT_UPDATE"}
+_PUU_ENV = {"routingKey": "support.update", "messageType": "PROJECT_USER_UPDATE"}
+
+# PROJECT_UPDATE payload로 복사할 원본 payload 필드 (camelCase -> snake_case)
+# branchCnt/commitCnt는 GitLab API에서 직접 제공하지 않으므로 원본에서 가져온다.
+_FIELD_MAP = (
+    ("groupId", "group_id"),
+    ("groupNm", "group_nm"),
+    ("parentGroupId", "parent_group_id"),
+    ("parentGroupNm", "parent_group_nm"),
+    ("createUserId", "create_user_id"),
+    ("createDttm", "create_dttm"),
+    ("updateUserId", "update_user_id"),
+    ("updateDttm", "update_dttm"),
+    ("branchCnt", "branch_cnt"),
+    ("commitCnt", "commit_cnt"),
+    ("pmsInfo", "pms_info"),
+    ("pluginsInfo", "plugins_info"),
+)
+
+# 필드 부재 표시용 sentinel (None 값과 구분)
+_MISSING = object()
+
+# 백그라운드 발행 큐 최대 크기 (가득 차면 핸들러 스레드에서 동기 발행)
+_PUBLISH_QUEUE_SIZE = 1024
+
+
+@dataclass(slots=True)
+class _ForkReq:
+    """GL_PROJECT_FORK payload 검증 결과"""
+    git_type: str
+    project_id: int
+    name: str
+    namespace_id: Optional[int] = None
+    path: Optional[str] = None
+    
+    @classmethod
+    def from_payload(cls, payload: Any, message_id: str) -> Optional["_ForkReq"]:
+        """
+        payload 필드를 한 번에 검증하여 요청 객체 생성
+        
+        Args:
+            payload: 메시지 payload
+            message_id: 메시지 ID (로그용)
+        
+        Returns:
+            _ForkReq 인스턴스 또는 None (검증 실패 시)
+        """
+        if not isinstance(payload, dict):
+            logger.warning(
+                "Invalid payload format for GL_PROJECT_FORK - "
+                "messageId=%s",
+                message_id
+            )
+            return None
+        
+        payload_get = payload.get
+        git_type = payload_get("gitType")
+        if not git_type:
+            logger.warning(
+                "Missing gitType in payload - "
+                "messageId=%s",
+                message_id
+            )
+            return None
+        
+        project_id = payload_get("projectId")
+        if not project_id:
+            logger.warning(
+                "Missing project_id in payload - "
+                "messageId=%s",
+                message_id
+            )
+            return None
+        
+        name = payload_get("name")
+        if not name:
+            logger.warning(
+                "Missing name in payload - "
+                "messageId=%s",
+                message_id
+            )
+            return None
+        
+        try:
+            project_id = int(project_id)
+        except (TypeError, ValueError):
+            # 숫자가 아닌 값은 재시도해도 실패하므로 검증 실패로 처리 (DLQ로 보내지 않음)
+            logger.warning(
+                "Invalid project_id in payload - "
+                "messageId=%s, project_id=%s",
+                message_id, project_id
+            )
+            return None
+        
+        return cls(
+            git_type=git_type,
+            project_id=project_id,
+            name=name,
+            namespace_id=payload_get("namespaceId"),
+            path=payload_get("path")
+        )
+
+
+@dataclass(slots=True)
+class _AddMemberReq:
+    """GL_PROJECT_ADD_MEMBER payload 검증 결과"""
+    git_type: str
+    project_id: Any
+    group_id: int
+    user_ids: Any  # username 리스트 또는 단일 username
+    access_level: int
+    
+    @classmethod
+    def from_payload(cls, payload: Any, message_id: str) -> Optional["_AddMemberReq"]:
+        """
+        payload 필드를 한 번에 검증하여 요청 객체 생성
+        
+        Args:
+            payload: 메시지 payload
+            message_id: 메시지 ID (로그용)
+        
+        Returns:
+            _AddMemberReq 인스턴스 또는 None (검증 실패 시)
+        """
+        if not isinstance(payload, dict):
+            logger.warning(
+                "Invalid payload format for GL_PROJECT_ADD_MEMBER - "
+                "messageId=%s",
+                message_id
+            )
+            return None
+        
+        payload_get = payload.get
+        git_type = payload_get("gitType")
+        if not git_type:
+            logger.warning(
+                "Missing gitType in payload - "
+                "messageId=%s",
+                message_id
+            )
+            return None
+        
+        project_id = payload_get("projectId")
+        user_ids = payload_get("userIds")
+        if not project_id or not user_ids:
+            logger.warning(
+                "Missing required fields in payload - "
+                "messageId=%s, "
+                "project_id=%s, user_id=%s",
+                message_id, project_id, user_ids
+            )
+            return None
+        
+        # 사용자마다 바뀌지 않는 값은 한 번만 변환 (access_level 기본값: Developer = 30)
+        access_level = payload_get("access_level", 30)
+        try:
+            group_id = int(project_id)
+            access_level = int(access_level)
+        except (TypeError, ValueError):
+            # 숫자가 아닌 값은 재시도해도 실패하므로 검증 실패로 처리 (DLQ로 보내지 않음)
+            logger.warning(
+                "Invalid numeric fields in payload - "
+                "messageId=%s, "
+                "project_id=%s, access_level=%s",
+                message_id, project_id, access_level
+            )
+            return None
+        
+        return cls(
+            git_type=git_type,
+            project_id=project_id,
+            group_id=group_id,
+            user_ids=user_ids,
+            access_level=access_level
+        )
+
+
+@dataclass(slots=True)
+class _JenkinsCopyReq:
+    """JENKINS_PROJECT_COPY payload 검증 결과"""
+    source_job_name: str
+    target_folder_path: str
+    new_job_name: str
+    
+    @classmethod
+    def from_payload(cls, payload: Any, message_id: str) -> Optional["_JenkinsCopyReq"]:
+        """
+        payload 필드를 한 번에 검증하여 요청 객체 생성
+        
+        Args:
+            payload: 메시지 payload
+            message_id: 메시지 ID (로그용)
+        
+        Returns:
+            _JenkinsCopyReq 인스턴스 또는 None (검증 실패 시)
+        """
+        if not isinstance(payload, dict):
+            logger.warning(
+                "Invalid payload format for JENKINS_PROJECT_COPY - "
+                "messageId=%s",
+                message_id
+            )
+            return None
+        
+        payload_get = payload.get
+        source_job_name = payload_get("sourceJobName")
+        target_folder_path = payload_get("targetFolderPath")
+        new_job_name = payload_get("newJobName")
+        if not source_job_name or not target_folder_path or not new_job_name:
+            logger.warning(
+                "Missing required fields in payload - "
+                "messageId=%s, "
+                "source_job_name=%s, "
+                "target_folder_path=%s, "
+                "new_job_name=%s",
+                message_id, source_job_name, target_folder_path, new_job_name
+            )
+            return None
+        
+        return cls(
+            source_job_name=source_job_name,
+            target_folder_path=target_folder_path,
+            new_job_name=new_job_name
+        )
+
+
+def _convert_gitlab_result_to_payload(
+    gitlab_result: Dict[str, Any],
+    original_payload: Dict[str, Any]
+) -> Dict[str, Any]:
+    """
+    GitLab API result를 ProjectUpdatePayload 형식으로 변환
+    
+    Args:
+        gitlab_result: GitLab API의 fork_project 결과
+        original_payload: 원본 메시지의 payload
+    
+    Returns:
+        ProjectUpdatePayload 형식의 딕셔너리
+    """
+    # GitLab result에서 필요한 정보 추출
+    project_id = str(gitlab_result.get("id", ""))
+    project_nm = gitlab_result.get("name", "")
+    
+    # namespace 정보 추출
+    namespace = gitlab_result.get("namespace", {})
+    # group_id = str(namespace.get("id", "")) if namespace else ""
+    # group_nm = namespace.get("name", "") if namespace else ""
+    
+    # # parent namespace 정보 추출 (있는 경우)
+    parent_namespace = namespace.get("parent", {}) if namespace else {}
+    parent_group_id = str(parent_namespace.get("id", "")) if parent_namespace else None
+    # parent_group_nm = parent_namespace.get("name", "") if parent_namespace else None
+    
+    # created_at을 LocalDateTime 형식으로 변환
+    # created_at = gitlab_result.get("created_at")
+    # create_dttm = None
+    # if created_at:
+    #     try:
+    #         # ISO 8601 형식의 문자열을 파싱
+    #         create_dttm = datetime.fromisoformat(created_at.replace("Z", "+00:00")).isoformat()
+    #     except Exception as e:
+    #         logger.warning(f"Failed to parse created_at: {created_at}, error: {e}")
+    
+    # # updated_at을 LocalDateTime 형식으로 변환
+    # updated_at = gitlab_result.get("last_activity_at") or gitlab_result.get("updated_at")
+    # update_dttm = None
+    # if updated_at:
+    #     try:
+    #         update_dttm = datetime.fromisoformat(updated_at.replace("Z", "+00:00")).isoformat()
+    #     except Exception as e:
+    #         logger.warning(f"Failed to parse updated_at: {updated_at}, error: {e}")
+    
+    # payload 구성
+    payload = {
+        "project_id": project_id,
+        "project_nm": project_nm,
+        "env_grp_nm": original_payload.get("gitType")
+    }
+    
+    # 원본 payload에 있는 필드만 snake_case로 복사 (필드별 조회 1회)
+    payload_get = original_payload.get
+    for src, dst in _FIELD_MAP:
+        value = payload_get(src, _MISSING)
+        if value is not _MISSING:
+            payload[dst] = value
+    
+    # parentGroupId가 없으면 GitLab 결과의 parent namespace ID 사용
+    if "parent_group_id" not in payload:
+        payload["parent_group_id"] = parent_group_id
+    
+    return payload
+
 
 class MessageService:
     def __init__(
@@ -28,49 +331,112 @@ class MessageService:
         self.service_name = service_name
         # GitLab 클라이언트 캐시 (gitType별로 캐싱)
         self._gitlab_clients: dict[str, GitLabClient] = {}
+        # 모든 GitLab 클라이언트가 공유하는 HTTP 세션 (인증 헤더는 클라이언트별로 요청 시 전달)
+        self._gitlab_http = make_session(headers={"Content-Type": "application/json"})
         # Jenkins 클라이언트 캐시 (단일 인스턴스)
         self._jenkins_client: Optional[JenkinsClient] = None
+        # Jenkins 클라이언트용 HTTP 세션
+        self._jenkins_http = make_session()
+        # 클라이언트 생성 시 중복 생성을 막기 위한 lock (조회는 lock 없이 수행)
+        self._gitlab_clients_lock = threading.Lock()
+        self._jenkins_client_lock = threading.Lock()
+        # 에러 로그 traceback 샘플링 (100건 중 1건만 traceback 포함)
+        self._error_sampler = itertools.cycle(range(100))
+        # Backend API 발행용 HTTP 세션 (메시지마다 커넥션을 새로 맺지 않도록 재사용)
+        self._http = self._create_backend_session()
+        # Backend API 메시지 발행 URL (발행마다 다시 조합하지 않도록 미리 계산)
+        self._publish_url = f"{self.config.backend_api_base_url}/api/messages/publish"
+        # Backend API 발행 종류별 함수
+        self._publishers = {
+            "PROJECT_UPDATE": self._publish_project_update,
+            "PROJECT_USER_UPDATE": self._publish_project_user_update,
+        }
+        # 백그라운드 발행 큐 및 Worker (핸들러가 Backend API 응답을 기다리지 않도록 함)
+        # Worker 스레드는 최초 발행 시 시작 (생성자에서 스레드를 띄우지 않음)
+        self._publish_q: queue.Queue = queue.Queue(maxsize=_PUBLISH_QUEUE_SIZE)
+        self._publish_thread: Optional[threading.Thread] = None
+        self._publish_closed = False
+        self._publish_lock = threading.Lock()
+        # messageType별 핸들러 (메시지마다 dict를 새로 만들지 않도록 한 번만 구성)
+        self._handlers = {
+            "GL_PROJECT_FORK": self._handle_project_fork,
+            "GL_PROJECT_ADD_MEMBER": self._handle_project_add_member,
+            "JENKINS_PROJECT_COPY": self._handle_jenkins_project_copy,
+        }
+        # 처리 가능한 messageType 집합 (알 수 없는 타입을 핸들러 조회 전에 걸러냄)
+        self._known_types = frozenset(self._handlers)
+    
+    @staticmethod
+    def _create_backend_session() -> requests.Session:
+        """
+        Backend API 발행용 HTTP 세션 생성
+        
+        단일 Backend 호스트로만 요청하므로 작은 커넥션 풀과 짧은 재시도 전략을 사용한다.
+        POST는 Backend가 요청을 처리하지 않았음이 분명한 503 응답만 재시도한다.
+        502/504 응답과 read timeout은 Backend가 이미 처리했을 수 있으므로 중복 발행 방지를 위해 재시도하지 않는다.
+        
+        Returns:
+            keep-alive 커넥션 풀이 설정된 requests.Session
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.25,
+                # 502/504는 게이트웨이가 Backend 응답을 받지 못한 것일 뿐 처리 여부를 알 수 없으므로 제외
+                status_forcelist=[503],
+                # 발행은 POST이므로 재시도 대상 메서드에 명시적으로 포함
+                allowed_methods=frozenset(["POST"]),
+                # 요청 전송 후 응답 대기 중 timeout은 Backend가 이미 처리했을 수 있으므로 재시도하지 않음
+                read=0,
+                raise_on_status=False
+            )
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.headers["Connection"] = "keep-alive"
+        return session
     
-    def handle_message(self, context: Dict[str, Any], message: Message):
+    def handle_message(self, worker_id: int, message: Message):
         """
         메시지 처리 메인 핸들러
         
         Args:
-            context: 메시지 컨텍스트 (message_id, correlation_id, worker_id 등)
+            worker_id: 메시지를 수신한 Worker ID
             message: 처리할 메시지
         """
-        message_type = message.header.message_type
-        message_id = message.header.message_id
+        header = message.header
+        message_type = header.message_type
+        message_id = header.message_id
         
         logger.info(
-            f"Handling message - messageId={message_id}, "
-            f"messageType={message_type}, "
-            f"correlationId={message.header.correlation_id}"
+            "Handling message - messageId=%s, "
+            "messageType=%s, "
+            "correlationId=%s",
+            message_id, message_type, header.correlation_id
         )
         
-        # messageType에 따라 분기 처리
-        handler_map = {
-            "GL_PROJECT_FORK": self._handle_project_fork,
-            "GL_PROJECT_ADD_MEMBER": self._handle_project_add_member,
-            "JENKINS_PROJECT_COPY": self._handle_jenkins_project_copy,
-        }
-        
-        handler = handler_map.get(message_type)
-        if handler:
-            try:
-                handler(context, message)
-            except Exception as e:
-                logger.error(
-                    f"Error handling message {message_type} - "
-                    f"messageId={message_id}, error={e}",
-                    exc_info=True
-                )
-                raise
-        else:
+        if message_type not in self._known_types:
             logger.warning(
-                f"Unknown message type: {message_type} - messageId={message_id}"
+                "Unknown message type: %s - messageId=%s",
+                message_type, message_id
             )
             # 알 수 없는 메시지 타입은 성공으로 처리 (에러 발생 안 함)
+            return
+        
+        # messageType에 따라 분기 처리
+        try:
+            self._handlers[message_type](message)
+        except Exception as e:
+            logger.error(
+                "Error handling message %s - "
+                "messageId=%s, error=%s",
+                message_type, message_id, e,
+                exc_info=next(self._error_sampler) == 0
+            )
+            raise
     
     def _get_gitlab_client(self, git_type: str) -> Optional[GitLabClient]:
         """
@@ -82,199 +448,165 @@ class MessageService:
         Returns:
             GitLabClient 인스턴스 또는 None
         """
-        # 캐시에 있으면 반환
-        if git_type in self._gitlab_clients:
-            return self._gitlab_clients[git_type]
-        
-        # 설정에서 GitLab 정보 가져오기
-        gitlab_config = self.config.get_gitlab_config(git_type)
-        if not gitlab_config:
-            logger.warning(
-                f"GitLab config not found for gitType: {git_type}"
+        # 캐시에 있으면 lock 없이 반환
+        client = self._gitlab_clients.get(git_type)
+        if client is not None:
+            return client
+        
+        with self._gitlab_clients_lock:
+            # 다른 스레드가 먼저 생성했는지 다시 확인
+            client = self._gitlab_clients.get(git_type)
+            if client is not None:
+                return client
+            
+            # 설정에서 GitLab 정보 가져오기
+            gitlab_config = self.config.get_gitlab_config(git_type)
+            if not gitlab_config:
+                logger.warning(
+                    "GitLab config not found for gitType: %s",
+                    git_type
+                )
+                return None
+            
+            # GitLab 클라이언트 생성 및 캐싱
+            client = GitLabClient(
+                base_url=gitlab_config["url"],
+                token=gitlab_config["token"],
+                timeout=gitlab_config["timeout"],
+                session=self._gitlab_http
             )
-            return None
-        
-        # GitLab 클라이언트 생성 및 캐싱
-        client = GitLabClient(
-            base_url=gitlab_config["url"],
-            token=gitlab_config["token"],
-            timeout=gitlab_config["timeout"]
-        )
-        self._gitlab_clients[git_type] = client
+            self._gitlab_clients[git_type] = client
         
         logger.info(
-            f"GitLab client created for gitType: {git_type}, "
-            f"url={gitlab_config['url']}"
+            "GitLab client created for gitType: %s, "
+            "url=%s",
+            git_type, gitlab_config['url']
         )
         
         return client
     
-    def _handle_project_fork(self, context: Dict[str, Any], message: Message):
+    def _handle_project_fork(self, message: Message):
         """프로젝트 fork 처리"""
+        message_id = message.header.message_id
+        
         logger.info(
-            f"Processing GL_PROJECT_FORK - messageId={message.header.message_id}"
+            "Processing GL_PROJECT_FORK - messageId=%s",
+            message_id
         )
         
         payload = message.body.payload
-        if not isinstance(payload, dict):
-            logger.warning(
-                f"Invalid payload format for GL_PROJECT_FORK - "
-                f"messageId={message.header.message_id}"
-            )
-            return
-        
-        # gitType 확인
-        git_type = payload.get("gitType")
-        if not git_type:
-            logger.warning(
-                f"Missing gitType in payload - "
-                f"messageId={message.header.message_id}"
-            )
+        req = _ForkReq.from_payload(payload, message_id)
+        if req is None:
             return
+        git_type = req.git_type
         
         # GitLab 클라이언트 가져오기
         gitlab_client = self._get_gitlab_client(git_type)
         if not gitlab_client:
             logger.error(
-                f"GitLab client not available for gitType: {git_type} - "
-                f"messageId={message.header.message_id}"
-            )
-            return
-        
-        # 필수 필드 확인
-        project_id = payload.get("projectId")
-        if not project_id:
-            logger.warning(
-                f"Missing project_id in payload - "
-                f"messageId={message.header.message_id}"
-            )
-            return
-        
-        name = payload.get("name")
-        if not name:
-            logger.warning(
-                f"Missing name in payload - "
-                f"messageId={message.header.message_id}"
+                "GitLab client not available for gitType: %s - "
+                "messageId=%s",
+                git_type, message_id
             )
             return
         
-        # 선택적 필드
-        namespace_id = payload.get("namespaceId")
-        path = payload.get("path")
-        
         # GitLab API 호출
         result = gitlab_client.fork_project(
-            project_id=int(project_id),
-            namespace_id=namespace_id,
-            name=name,
-            path=path
+            project_id=req.project_id,
+            namespace_id=req.namespace_id,
+            name=req.name,
+            path=req.path
         )
         
         logger.info(
-            f"Successfully processed GL_PROJECT_FORK - "
-            f"messageId={message.header.message_id}, "
-            f"gitType={git_type}, "
-            f"forkedProjectId={result.get('id')}"
+            "Successfully processed GL_PROJECT_FORK - "
+            "messageId=%s, "
+            "gitType=%s, "
+            "forkedProjectId=%s",
+            message_id, git_type, result.get('id')
         )
         
-        # Backend API 호출하여 PROJECT_UPDATE 메시지 발행
-        try:
-            self._publish_project_update(result, payload)
-        except Exception as e:
-            logger.error(
-                f"Failed to publish PROJECT_UPDATE message - "
-                f"messageId={message.header.message_id}, "
-                f"error={e}",
-                exc_info=True
-            )
-            # Backend API 호출 실패는 경고로만 처리 (fork는 성공했으므로)
+        # Backend API 호출하여 PROJECT_UPDATE 메시지 발행 (백그라운드)
+        # Backend API 호출 실패는 로그로만 처리 (fork는 성공했으므로)
+        self._submit_publish("PROJECT_UPDATE", message_id, (result, payload))
     
-    def _handle_project_add_member(self, context: Dict[str, Any], message: Message):
+    def _handle_project_add_member(self, message: Message):
         """프로젝트에 사용자 추가 처리"""
+        message_id = message.header.message_id
+        
         logger.info(
-            f"Processing GL_PROJECT_ADD_MEMBER - "
-            f"messageId={message.header.message_id}"
+            "Processing GL_PROJECT_ADD_MEMBER - "
+            "messageId=%s",
+            message_id
         )
         
-        payload = message.body.payload
-        if not isinstance(payload, dict):
-            logger.warning(
-                f"Invalid payload format for GL_PROJECT_ADD_MEMBER - "
-                f"messageId={message.header.message_id}"
-            )
-            return
-        
-        # gitType 확인
-        git_type = payload.get("gitType")
-        if not git_type:
-            logger.warning(
-                f"Missing gitType in payload - "
-                f"messageId={message.header.message_id}"
-            )
+        req = _AddMemberReq.from_payload(message.body.payload, message_id)
+        if req is None:
             return
+        git_type = req.git_type
         
         # GitLab 클라이언트 가져오기
         gitlab_client = self._get_gitlab_client(git_type)
         if not gitlab_client:
             logger.error(
-                f"GitLab client not available for gitType: {git_type} - "
-                f"messageId={message.header.message_id}"
+                "GitLab client not available for gitType: %s - "
+                "messageId=%s",
+                git_type, message_id
             )
             return
         
-        # 필수 필드 확인
-        project_id = payload.get("projectId")
-        user_id = payload.get("userIds")
-        
-        if not project_id or not user_id:
-            logger.warning(
-                f"Missing required fields in payload - "
-                f"messageId={message.header.message_id}, "
-                f"project_id={project_id}, user_id={user_id}"
-            )
-            return
-        
-        # 선택적 필드 (기본값: Developer = 30)
-        access_level = payload.get("access_level", 30)
+        project_id = req.project_id
+        user_id = req.user_ids
+        group_id = req.group_id
+        access_level = req.access_level
         
         # user_id가 리스트인지 확인 (userIds는 username을 담고 있음)
         if isinstance(user_id, list):
-            # 리스트인 경우 각 username에 대해 처리
+            # 리스트인 경우 각 username에 대해 병렬로 처리
             results = []
             success_user_ids = []
-            for username in user_id:
+            futures = {
+                _MEMBER_POOL.submit(
+                    gitlab_client.add_project_member,
+                    group_id=group_id,
+                    username=str(username),
+                    access_level=access_level
+                ): username
+                for username in user_id
+            }
+            for future in as_completed(futures):
+                username = futures[future]
                 try:
-                    result = gitlab_client.add_project_member(
-                        group_id=int(project_id),
-                        username=str(username),
-                        access_level=int(access_level)
-                    )
+                    result = future.result()
                     results.append(result)
                     success_user_ids.append(str(username))
                     logger.info(
-                        f"Successfully added member - "
-                        f"messageId={message.header.message_id}, "
-                        f"gitType={git_type}, "
-                        f"groupId={project_id}, username={username}, "
-                        f"memberId={result.get('id')}"
+                        "Successfully added member - "
+                        "messageId=%s, "
+                        "gitType=%s, "
+                        "groupId=%s, username=%s, "
+                        "memberId=%s",
+                        message_id, git_type, project_id, username, result.get('id')
                     )
                 except Exception as e:
                     logger.error(
-                        f"Failed to add member - "
-                        f"messageId={message.header.message_id}, "
-                        f"gitType={git_type}, "
-                        f"groupId={project_id}, username={username}, "
-                        f"error={e}",
-                        exc_info=True
+                        "Failed to add member - "
+                        "messageId=%s, "
+                        "gitType=%s, "
+                        "groupId=%s, username=%s, "
+                        "error=%s",
+                        message_id, git_type, project_id, username, e,
+                        exc_info=next(self._error_sampler) == 0
                     )
             
             logger.info(
-                f"Successfully processed GL_PROJECT_ADD_MEMBER (list) - "
-                f"messageId={message.header.message_id}, "
-                f"gitType={git_type}, "
-                f"projectId={project_id}, "
-                f"totalUsers={len(user_id)}, "
-                f"successCount={len(results)}"
+                "Successfully processed GL_PROJECT_ADD_MEMBER (list) - "
+                "messageId=%s, "
+                "gitType=%s, "
+                "projectId=%s, "
+                "totalUsers=%s, "
+                "successCount=%s",
+                message_id, git_type, project_id, len(user_id), len(results)
             )
             
             # Backend API 호출하여 PROJECT_USER_UPDATE 메시지 발행
@@ -296,17 +628,18 @@ class MessageService:
         else:
             # 단일 값인 경우 (userIds는 username을 담고 있음)
             result = gitlab_client.add_project_member(
-                group_id=int(project_id),
+                group_id=group_id,
                 username=str(user_id),
-                access_level=int(access_level)
+                access_level=access_level
             )
             
             logger.info(
-                f"Successfully processed GL_PROJECT_ADD_MEMBER - "
-                f"messageId={message.header.message_id}, "
-                f"gitType={git_type}, "
-                f"groupId={project_id}, username={user_id}, "
-                f"memberId={result.get('id')}"
+                "Successfully processed GL_PROJECT_ADD_MEMBER - "
+                "messageId=%s, "
+                "gitType=%s, "
+                "groupId=%s, username=%s, "
+                "memberId=%s",
+                message_id, git_type, project_id, user_id, result.get('id')
             )
             
             # Backend API 호출하여 PROJECT_USER_UPDATE 메시지 발행
@@ -332,67 +665,64 @@ class MessageService:
         Returns:
             JenkinsClient 인스턴스 또는 None
         """
-        # 캐시에 있으면 반환
-        if self._jenkins_client:
-            return self._jenkins_client
-        
-        # 설정에서 Jenkins 정보 가져오기
-        jenkins_config = self.config.get_jenkins_config()
-        if not jenkins_config:
-            logger.warning("Jenkins config not found")
-            return None
-        
-        # Jenkins 클라이언트 생성 및 캐싱
-        client = JenkinsClient(
-            base_url=jenkins_config["url"],
-            username=jenkins_config["username"],
-            password=jenkins_config["password"],
-            timeout=jenkins_config["timeout"]
-        )
-        self._jenkins_client = client
+        # 캐시에 있으면 lock 없이 반환
+        client = self._jenkins_client
+        if client is not None:
+            return client
+        
+        with self._jenkins_client_lock:
+            # 다른 스레드가 먼저 생성했는지 다시 확인
+            client = self._jenkins_client
+            if client is not None:
+                return client
+            
+            # 설정에서 Jenkins 정보 가져오기
+            jenkins_config = self.config.get_jenkins_config()
+            if not jenkins_config:
+                logger.warning("Jenkins config not found")
+                return None
+            
+            # Jenkins 클라이언트 생성 및 캐싱
+            client = JenkinsClient(
+                base_url=jenkins_config["url"],
+                username=jenkins_config["username"],
+                password=jenkins_config["password"],
+                timeout=jenkins_config["timeout"],
+                session=self._jenkins_http
+            )
+            self._jenkins_client = client
         
         logger.info(
-            f"Jenkins client created - url={jenkins_config['url']}"
+            "Jenkins client created - url=%s",
+            jenkins_config['url']
         )
         
         return client
     
-    def _handle_jenkins_project_copy(self, context: Dict[str, Any], message: Message):
+    def _handle_jenkins_project_copy(self, message: Message):
         """Jenkins 프로젝트 복사 처리"""
+        message_id = message.header.message_id
+        
         logger.info(
-            f"Processing JENKINS_PROJECT_COPY - "
-            f"messageId={message.header.message_id}"
+            "Processing JENKINS_PROJECT_COPY - "
+            "messageId=%s",
+            message_id
         )
         
-        payload = message.body.payload
-        if not isinstance(payload, dict):
-            logger.warning(
-                f"Invalid payload format for JENKINS_PROJECT_COPY - "
-                f"messageId={message.header.message_id}"
-            )
+        req = _JenkinsCopyReq.from_payload(message.body.payload, message_id)
+        if req is None:
             return
+        source_job_name = req.source_job_name
+        target_folder_path = req.target_folder_path
+        new_job_name = req.new_job_name
         
         # Jenkins 클라이언트 가져오기
         jenkins_client = self._get_jenkins_client()
         if not jenkins_client:
             logger.error(
-                f"Jenkins client not available - "
-                f"messageId={message.header.message_id}"
-            )
-            return
-        
-        # 필수 필드 확인
-        source_job_name = payload.get("sourceJobName")
-        target_folder_path = payload.get("targetFolderPath")
-        new_job_name = payload.get("newJobName")
-        
-        if not source_job_name or not target_folder_path or not new_job_name:
-            logger.warning(
-                f"Missing required fields in payload - "
-                f"messageId={message.header.message_id}, "
-                f"source_job_name={source_job_name}, "
-                f"target_folder_path={target_folder_path}, "
-                f"new_job_name={new_job_name}"
+                "Jenkins client not available - "
+                "messageId=%s",
+                message_id
             )
             return
         
@@ -403,16 +733,107 @@ class MessageService:
             new_job_name=new_job_name
         )
         
-        final_path = f"{target_folder_path.rstrip('/')}/{new_job_name}".lstrip('/')
-        logger.info(
-            f"Successfully processed JENKINS_PROJECT_COPY - "
-            f"messageId={message.header.message_id}, "
-            f"sourceJobName={source_job_name}, "
-            f"targetFolder={target_folder_path}, "
-            f"newJobName={new_job_name}, "
-            f"finalPath={final_path}, "
-            f"jobUrl={result.get('url', 'N/A')}"
+        # finalPath는 로그 전용 값이므로 INFO 로그가 활성화된 경우에만 계산
+        if logger.isEnabledFor(logging.INFO):
+            final_path = f"{target_folder_path.rstrip('/')}/{new_job_name}".lstrip('/')
+            logger.info(
+                "Successfully processed JENKINS_PROJECT_COPY - "
+                "messageId=%s, "
+                "sourceJobName=%s, "
+                "targetFolder=%s, "
+                "newJobName=%s, "
+                "finalPath=%s, "
+                "jobUrl=%s",
+                message_id, source_job_name, target_folder_path, new_job_name, final_path, result.get('url', 'N/A')
+            )
+    
+    def close(self, timeout: Optional[float] = None):
+        """
+        백그라운드 발행 Worker 종료 (큐에 남은 발행을 처리한 후 종료)
+        
+        handler는 발행 전에 ack하므로 큐에 남은 발행은 재전달되지 않는다.
+        기본값(None)은 큐가 모두 비워질 때까지 대기한다.
+        
+        Args:
+            timeout: Worker 종료 대기 시간 (초, None이면 제한 없음)
+        """
+        # 종료 표시 이후의 발행은 큐에 넣지 않으므로 sentinel이 마지막 항목이 됨
+        with self._publish_lock:
+            if self._publish_closed:
+                return
+            self._publish_closed = True
+            thread = self._publish_thread
+        
+        if thread is not None:
+            self._publish_q.put(None)
+            thread.join(timeout=timeout)
+            if thread.is_alive():
+                # 대기 시간 초과 시 버려지는 발행을 메시지 ID로 기록
+                with self._publish_q.mutex:
+                    dropped = [item[1] for item in self._publish_q.queue if item is not None]
+                logger.warning(
+                    "Backend publisher did not finish within %ss - "
+                    "dropped=%s, messageIds=%s",
+                    timeout, len(dropped), dropped
+                )
+        
+        # Backend API 세션 종료 (전용 어댑터 커넥션 풀 해제)
+        self._http.close()
+    
+    def _submit_publish(self, kind: str, message_id: str, args: tuple):
+        """
+        Backend API 발행을 백그라운드 큐에 등록
+        
+        큐가 가득 찬 경우 호출한 스레드에서 동기로 발행하여 backpressure를 유지하고,
+        close() 이후에는 Worker가 없으므로 동기로 발행한다.
+        
+        Args:
+            kind: 발행 메시지 타입 (PROJECT_UPDATE, PROJECT_USER_UPDATE)
+            message_id: 원본 메시지 ID (로그용)
+            args: 발행 함수 인자
+        """
+        with self._publish_lock:
+            closed = self._publish_closed
+            if not closed:
+                if self._publish_thread is None:
+                    self._publish_thread = threading.Thread(
+                        target=self._publish_worker,
+                        name="backend-publisher",
+                        daemon=True
+                    )
+                    self._publish_thread.start()
+                try:
+                    self._publish_q.put_nowait((kind, message_id, args))
+                    return
+                except queue.Full:
+                    pass
+        
+        logger.warning(
+            "Publish queue %s, publishing %s synchronously - messageId=%s",
+            "closed" if closed else "full", kind, message_id
         )
+        self._run_publish(kind, message_id, args)
+    
+    def _run_publish(self, kind: str, message_id: str, args: tuple):
+        """발행 함수 실행 (실패는 로그로만 처리)"""
+        try:
+            self._publishers[kind](*args)
+        except Exception as e:
+            logger.error(
+                "Failed to publish %s message - "
+                "messageId=%s, "
+                "error=%s",
+                kind, message_id, e,
+                exc_info=next(self._error_sampler) == 0
+            )
+    
+    def _publish_worker(self):
+        """백그라운드 발행 Worker 메인 루프 (None을 받으면 종료)"""
+        while True:
+            item = self._publish_q.get()
+            if item is None:
+                break
+            self._run_publish(*item)
     
     def _publish_project_update(self, gitlab_result: Dict[str, Any], original_payload: Dict[str, Any]):
         """
@@ -422,45 +843,42 @@ class MessageService:
             gitlab_result: GitLab API의 fork_project 결과
             original_payload: 원본 메시지의 payload
         """
-        backend_url = self.config.backend_api_base_url
-        api_url = f"{backend_url}/api/messages/publish"
-        
         # GitLab result를 ProjectUpdatePayload 형식으로 변환
-        payload = self._convert_gitlab_result_to_payload(gitlab_result, original_payload)
+        payload = _convert_gitlab_result_to_payload(gitlab_result, original_payload)
         
         # 요청 본문 구성
-        request_body = {
-            "routingKey": "support.update",
-            "messageType": "PROJECT_UPDATE",
-            "payload": payload
-        }
-        
-        # HTTP 헤더 설정
-        headers = {
-            "Content-Type": "application/json"
-        }
+        request_body = {**_PU_ENV, "payload": payload}
         
-        logger.info(f"Publishing PROJECT_UPDATE message to backend API - url: {api_url}")
+        logger.info(
+            "Publishing PROJECT_UPDATE message to backend API - url: %s",
+            self._publish_url
+        )
         
         # API 호출
-        response = requests.post(
-            api_url,
-            json=request_body,
-            headers=headers,
+        response = self._http.post(
+            self._publish_url,
+            data=orjson.dumps(request_body, option=orjson.OPT_NON_STR_KEYS),
+            headers=_HEADERS,
             timeout=30
         )
         
         response.raise_for_status()
         
-        response_data = response.json()
+        # 본문이 없는 응답(204 등)은 파싱 없이 성공으로 처리
+        if not response.content:
+            logger.info("PROJECT_UPDATE message published successfully - status: %s", response.status_code)
+            return
+        
+        response_data = orjson.loads(response.content)
         if response_data.get("success"):
             logger.info(
-                f"PROJECT_UPDATE message published successfully - "
-                f"messageId: {response_data.get('messageId')}"
+                "PROJECT_UPDATE message published successfully - "
+                "messageId: %s",
+                response_data.get('messageId')
             )
         else:
             error_msg = response_data.get("error", "Unknown error")
-            logger.error(f"Failed to publish PROJECT_UPDATE message - error: {error_msg}")
+            logger.error("Failed to publish PROJECT_UPDATE message - error: %s", error_msg)
             raise Exception(f"Failed to publish PROJECT_UPDATE: {error_msg}")
     
     def _publish_project_user_update(
@@ -477,9 +895,6 @@ class MessageService:
             git_type: GitLab 타입
             user_ids: 사용자 ID 리스트
         """
-        backend_url = self.config.backend_api_base_url
-        api_url = f"{backend_url}/api/messages/publish"
-        
         # ProjectUserUpdatePayload 형식으로 변환
         payload = {
             "projectId": project_id,
@@ -488,133 +903,37 @@ class MessageService:
         }
         
         # 요청 본문 구성
-        request_body = {
-            "routingKey": "support.update",
-            "messageType": "PROJECT_USER_UPDATE",
-            "payload": payload
-        }
-        
-        # HTTP 헤더 설정
-        headers = {
-            "Content-Type": "application/json"
-        }
+        request_body = {**_PUU_ENV, "payload": payload}
         
         logger.info(
-            f"Publishing PROJECT_USER_UPDATE message to backend API - "
-            f"url: {api_url}, projectId: {project_id}, userIds: {user_ids}"
+            "Publishing PROJECT_USER_UPDATE message to backend API - "
+            "url: %s, projectId: %s, userIds: %s",
+            self._publish_url, project_id, user_ids
         )
         
         # API 호출
-        response = requests.post(
-            api_url,
-            json=request_body,
-            headers=headers,
+        response = self._http.post(
+            self._publish_url,
+            data=orjson.dumps(request_body, option=orjson.OPT_NON_STR_KEYS),
+            headers=_HEADERS,
             timeout=30
         )
         
         response.raise_for_status()
         
-        response_data = response.json()
+        # 본문이 없는 응답(204 등)은 파싱 없이 성공으로 처리
+        if not response.content:
+            logger.info("PROJECT_USER_UPDATE message published successfully - status: %s", response.status_code)
+            return
+        
+        response_data = orjson.loads(response.content)
         if response_data.get("success"):
             logger.info(
-                f"PROJECT_USER_UPDATE message published successfully - "
-                f"messageId: {response_data.get('messageId')}"
+                "PROJECT_USER_UPDATE message published successfully - "
+                "messageId: %s",
+                response_data.get('messageId')
             )
         else:
             error_msg = response_data.get("error", "Unknown error")
-            logger.error(f"Failed to publish PROJECT_USER_UPDATE message - error: {error_msg}")
+            logger.error("Failed to publish PROJECT_USER_UPDATE message - error: %s", error_msg)
             raise Exception(f"Failed to publish PROJECT_USER_UPDATE: {error_msg}")
-    
-    def _convert_gitlab_result_to_payload(
-        self,
-        gitlab_result: Dict[str, Any],
-        original_payload: Dict[str, Any]
-    ) -> Dict[str, Any]:
-        """
-        GitLab API result를 ProjectUpdatePayload 형식으로 변환
-        
-        Args:
-            gitlab_result: GitLab API의 fork_project 결과
-            original_payload: 원본 메시지의 payload
-        
-        Returns:
-            ProjectUpdatePayload 형식의 딕셔너리
-        """
-        # GitLab result에서 필요한 정보 추출
-        project_id = str(gitlab_result.get("id", ""))
-        project_nm = gitlab_result.get("name", "")
-        
-        # namespace 정보 추출
-        namespace = gitlab_result.get("namespace", {})
-        # group_id = str(namespace.get("id", "")) if namespace else ""
-        # group_nm = namespace.get("name", "") if namespace else ""
-        
-        # # parent namespace 정보 추출 (있는 경우)
-        parent_namespace = namespace.get("parent", {}) if namespace else {}
-        parent_group_id = str(parent_namespace.get("id", "")) if parent_namespace else None
-        # parent_group_nm = parent_namespace.get("name", "") if parent_namespace else None
-        
-        # created_at을 LocalDateTime 형식으로 변환
-        # created_at = gitlab_result.get("created_at")
-        # create_dttm = None
-        # if created_at:
-        #     try:
-        #         # ISO 8601 형식의 문자열을 파싱
-        #         create_dttm = datetime.fromisoformat(created_at.replace("Z", "+00:00")).isoformat()
-        #     except Exception as e:
-        #         logger.warning(f"Failed to parse created_at: {created_at}, error: {e}")
-        
-        # # updated_at을 LocalDateTime 형식으로 변환
-        # updated_at = gitlab_result.get("last_activity_at") or gitlab_result.get("updated_at")
-        # update_dttm = None
-        # if updated_at:
-        #     try:
-        #         update_dttm = datetime.fromisoformat(updated_at.replace("Z", "+00:00")).isoformat()
-        #     except Exception as e:
-        #         logger.warning(f"Failed to parse updated_at: {updated_at}, error: {e}")
-        
-        # 원본 payload에서 추가 정보 가져오기 (있는 경우)
-        create_user_id = original_payload.get("createUserId")
-        update_user_id = original_payload.get("updateUserId")
-        env_grp_nm = original_payload.get("gitType")
-             # payload 구성
-        payload = {
-            "project_id": project_id,
-            "project_nm": project_nm,
-            "env_grp_nm": env_grp_nm
-        }
-        if "groupId" in original_payload:
-            payload["group_id"] = original_payload.get("groupId")
-        if "groupNm" in original_payload:
-            payload["group_nm"] = original_payload.get("groupNm")
-
-   
-        if "parentGroupId" in original_payload:
-            payload["parent_group_id"] = original_payload.get("parentGroupId")
-        else:
-            payload["parent_group_id"] = parent_group_id
-        if "parentGroupNm" in original_payload:
-            payload["parent_group_nm"] = original_payload.get("parentGroupNm")
-        if "createUserId" in original_payload:
-            payload["create_user_id"] = original_payload.get("createUserId")
-        if "createDttm" in original_payload:
-            payload["create_dttm"] = original_payload.get("createDttm")
-        if "updateUserId" in original_payload:
-            payload["update_user_id"] = original_payload.get("updateUserId")
-        if "updateDttm" in original_payload:
-            payload["update_dttm"] = original_payload.get("updateDttm")
-
-        
-        # branch_cnt, commit_cnt는 GitLab API에서 직접 제공하지 않으므로 None 또는 원본에서 가져오기
-        if "branchCnt" in original_payload:
-            payload["branch_cnt"] = original_payload.get("branchCnt")
-        if "commitCnt" in original_payload:
-            payload["commit_cnt"] = original_payload.get("commitCnt")
-        
-        # pms_info, plugins_info는 원본에서 가져오기
-        if "pmsInfo" in original_payload:
-            payload["pms_info"] = original_payload.get("pmsInfo")
-        if "pluginsInfo" in original_payload:
-            payload["plugins_info"] = original_payload.get("pluginsInfo")
-        
-        return payload
\ No newline at end of file